@@ -1,5 +1,36 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { DICTIONARIES } from '@/lib/dictionary';
+import { DICTIONARIES, parseWordList } from '@/lib/dictionary';
+
+// Parsed word lists, kept for the lifetime of the server instance. The in-flight promise is
+// cached so concurrent cold requests share one download and parse.
+const wordListCache = new Map<string, Promise<string[]>>();
+
+// Dictionaries never change, so let the browser and CDN keep the response
+const CACHE_CONTROL = 'public, max-age=86400, s-maxage=604800, stale-while-revalidate=86400';
+
+/**
+ * Fetch and parse a dictionary's word list, sharing the result across requests
+ */
+function loadWordList(dictName: string, url: string): Promise<string[]> {
+  let words = wordListCache.get(dictName);
+  if (!words) {
+    words = fetch(url)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`Failed to fetch dictionary (HTTP ${response.status})`);
+        }
+        return response.text();
+      })
+      .then(parseWordList)
+      .catch((error) => {
+        // Don't cache failures; the next request retries
+        wordListCache.delete(dictName);
+        throw error;
+      });
+    wordListCache.set(dictName, words);
+  }
+  return words;
+}
 
 export async function GET(request: NextRequest) {
   const searchParams = request.nextUrl.searchParams;
@@ -12,19 +43,12 @@ export async function GET(request: NextRequest) {
   const dictInfo = DICTIONARIES[dictName];
   
   try {
-    // Try to fetch from URL
-    const response = await fetch(dictInfo.url);
-    if (!response.ok) {
-      return NextResponse.json({ error: 'Failed to fetch dictionary' }, { status: 500 });
-    }
-    
-    const text = await response.text();
-    const words = text
-      .split('\n')
-      .map(line => line.trim().toLowerCase())
-      .filter(word => word.length >= 2);
+    const words = await loadWordList(dictName, dictInfo.url);
     
-    return NextResponse.json({ words, count: words.length });
+    return NextResponse.json(
+      { words, count: words.length },
+      { headers: { 'Cache-Control': CACHE_CONTROL } }
+    );
   } catch (error) {
     return NextResponse.json(
       { error: `Error loading dictionary: ${error instanceof Error ? error.message : 'Unknown error'}` },
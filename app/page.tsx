@@ -1,7 +1,7 @@
 'use client';
 
 import { useState, useRef, useEffect } from 'react';
-import { extractTilesFromImage, PreprocessingMode, ScalingMode } from '@/lib/ocr';
+import { extractTilesFromImage, terminateWorkerPool, PreprocessingMode, ScalingMode } from '@/lib/ocr';
 import { solveQuartiles, WordResult } from '@/lib/solver';
 import { DictionaryType } from '@/lib/dictionary';
 import type { DebugImage } from '@/lib/tile-detector';
@@ -205,6 +205,13 @@ export default function Home() {
     };
   }, [imagePreview]);
 
+  // Release the shared OCR workers on unmount
+  useEffect(() => {
+    return () => {
+      terminateWorkerPool();
+    };
+  }, []);
+
   const formatTilesGrid = (tiles: string[]) => {
     const cols = 4;
     const rows: string[][] = [];
@@ -22,21 +22,50 @@ export const DICTIONARIES: Record<string, DictionaryInfo> = {
   }
 };
 
+const PROFANITY: ReadonlySet<string> = new Set([
+  'fuck', 'shit', 'bitch', 'dick', 'piss', 'cock', 'cunt', 'twat', 'ass', 'damn', 'hell'
+]);
+
+const ALPHABETIC_WORD = /^[a-z]+$/;
+const VOWEL = /[aeiou]/;
+
+/**
+ * Parse a newline-separated word list into the words usable by the solver. The whole text
+ * is lowercased in one call and split on CRLF or LF, so no per-line trim is needed for the
+ * dictionary files. Non-alphabetic entries and profanity are dropped in the same pass.
+ */
+export function parseWordList(text: string): string[] {
+  return text
+    .toLowerCase()
+    .split(/\r?\n/)
+    .filter(word => word.length >= 2 && ALPHABETIC_WORD.test(word) && !PROFANITY.has(word));
+}
+
 // Cache for loaded dictionaries
 const dictionaryCache = new Map<string, Set<string>>();
 
 export async function loadDictionary(dictName: string): Promise<Set<string>> {
+  // Check cache first
+  if (dictionaryCache.has(dictName)) {
+    return dictionaryCache.get(dictName)!;
+  }
+
   if (dictName === 'both') {
     const [words1, words2] = await Promise.all([
       loadDictionary('twl06'),
       loadDictionary('enable')
     ]);
-    return new Set([...words1, ...words2]);
-  }
-
-  // Check cache first
-  if (dictionaryCache.has(dictName)) {
-    return dictionaryCache.get(dictName)!;
+    // Grow a copy of one set rather than spreading both into an intermediate array
+    const merged = new Set(words1);
+    for (const word of words2) {
+      merged.add(word);
+    }
+    // Reuse the union on later solves, but only once both halves actually loaded
+    // (failed loads return an uncached empty set)
+    if (dictionaryCache.get('twl06') === words1 && dictionaryCache.get('enable') === words2) {
+      dictionaryCache.set(dictName, merged);
+    }
+    return merged;
   }
 
   if (!DICTIONARIES[dictName]) {
@@ -64,10 +93,7 @@ export async function loadDictionary(dictName: string): Promise<Set<string>> {
         return new Set();
       }
       const text = await urlResponse.text();
-      words = text
-        .split('\n')
-        .map(line => line.trim().toLowerCase())
-        .filter(word => word.length >= 2);
+      words = parseWordList(text);
     }
     
     const wordSet = new Set(words);
@@ -79,22 +105,10 @@ export async function loadDictionary(dictName: string): Promise<Set<string>> {
   }
 }
 
-export function filterWords(words: Set<string>): Set<string> {
-  const profanity = new Set(['fuck', 'shit', 'bitch', 'dick', 'piss', 'cock', 'cunt', 'twat', 'ass', 'damn', 'hell']);
-  const filtered = new Set<string>();
-  
-  for (const word of words) {
-    if (/^[a-z]+$/.test(word) && !profanity.has(word)) {
-      filtered.add(word);
-    }
-  }
-  
-  return filtered;
-}
-
 export function classifyWord(word: string): string[] {
   const tags: string[] = [];
-  if (word.length <= 3 && /^[bcdfghjklmnpqrstvwxyz]+$/.test(word)) {
+  // Words are a-z only, so "all consonants" is "no vowel"; the search stops at the first vowel
+  if (word.length <= 3 && !VOWEL.test(word)) {
     tags.push('abbreviation');
   }
   return tags;
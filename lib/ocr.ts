@@ -115,6 +115,43 @@ class WorkerPool {
   }
 }
 
+// Shared across extractions so re-running OCR (e.g. after changing preprocessing)
+// doesn't pay for creating workers and loading the language data again
+let sharedPool: Promise<WorkerPool> | null = null;
+
+/**
+ * Get the shared worker pool, initializing it on first use
+ */
+function getWorkerPool(): Promise<WorkerPool> {
+  if (!sharedPool) {
+    const pool = new WorkerPool();
+    sharedPool = pool.initialize(WORKER_POOL_SIZE).then(
+      () => pool,
+      (error) => {
+        sharedPool = null;
+        throw error;
+      }
+    );
+  }
+  return sharedPool;
+}
+
+/**
+ * Terminate the shared worker pool, e.g. when the page unmounts
+ */
+export async function terminateWorkerPool(): Promise<void> {
+  const pool = sharedPool;
+  sharedPool = null;
+  if (!pool) return;
+  
+  try {
+    await (await pool).terminate();
+  } catch (error) {
+    // A pool that failed to initialize has no workers left to terminate
+    console.warn('Failed to terminate OCR worker pool:', error);
+  }
+}
+
 /**
  * Convert canvas to data URL for debugging
  */
@@ -236,11 +273,21 @@ function prepareTileForOCR(
   return processed;
 }
 
+const NON_LETTERS = /[^a-z]/g;
+const SINGLE_LETTER = /^[a-z]$/;
+
+/**
+ * Lowercase OCR text and strip everything that isn't a letter. Removing non-letters
+ * already drops surrounding whitespace, so no separate trim is needed.
+ */
+function cleanOCRText(text: string): string {
+  return text.toLowerCase().replace(NON_LETTERS, '');
+}
+
 /**
  * Parse OCR result to extract text and confidence
  */
 function parseOCRResult(data: any): { text: string | null; confidence: number } {
-  const fullText = (data.text || '').trim().toLowerCase();
   const words = data.words || [];
   const lines = data.lines || [];
   const symbols = data.symbols || [];
@@ -249,38 +296,30 @@ function parseOCRResult(data: any): { text: string | null; confidence: number }
   const candidates: Array<{ text: string; conf: number }> = [];
   
   // From full text
-  if (fullText) {
-    const cleaned = fullText.replace(/[^a-z]/g, '').trim();
-    if (cleaned.length >= 2 && cleaned.length <= 10) {
-      candidates.push({ text: cleaned, conf: 60 });
-    }
+  const fullText = cleanOCRText(data.text || '');
+  if (fullText.length >= 2 && fullText.length <= 10) {
+    candidates.push({ text: fullText, conf: 60 });
   }
   
   // From lines
   for (const line of lines) {
-    const text = (line.text || '').trim().toLowerCase();
-    if (text) {
-      const cleaned = text.replace(/[^a-z]/g, '').trim();
-      if (cleaned.length >= 2 && cleaned.length <= 10) {
-        candidates.push({ text: cleaned, conf: line.confidence || 50 });
-      }
+    const cleaned = cleanOCRText(line.text || '');
+    if (cleaned.length >= 2 && cleaned.length <= 10) {
+      candidates.push({ text: cleaned, conf: line.confidence || 50 });
     }
   }
   
   // From words
   for (const word of words) {
-    const text = (word.text || '').trim().toLowerCase();
-    if (text) {
-      const cleaned = text.replace(/[^a-z]/g, '').trim();
-      if (cleaned.length >= 2 && cleaned.length <= 10) {
-        candidates.push({ text: cleaned, conf: word.confidence || 30 });
-      }
+    const cleaned = cleanOCRText(word.text || '');
+    if (cleaned.length >= 2 && cleaned.length <= 10) {
+      candidates.push({ text: cleaned, conf: word.confidence || 30 });
     }
   }
   
   // From symbols - most reliable for short tiles
   const sortedSymbols = [...symbols]
-    .filter(s => /^[a-z]$/.test((s.text || '').trim().toLowerCase()))
+    .filter(s => SINGLE_LETTER.test((s.text || '').trim().toLowerCase()))
     .sort((a, b) => (a.bbox?.x0 || 0) - (b.bbox?.x0 || 0));
   
   let symbolText = '';
@@ -404,7 +443,7 @@ async function processTilesBatch(
 }
 
 /**
- * Main extraction function - optimized with worker pool and early exit
+ * Main extraction function - optimized with shared worker pool and early exit
  */
 export async function extractTilesFromImage(
   imageFile: File,
@@ -417,115 +456,114 @@ export async function extractTilesFromImage(
 ): Promise<DetectionResult> {
   const totalStartTime = performance.now();
   
-  // Load the image
-  const canvas = await loadImageToCanvas(imageFile);
+  // Start bringing up the worker pool while the image loads and tile regions are detected;
+  // none of them depends on the others. The pool is only awaited once there are regions to
+  // OCR, so a failed worker start can't turn "no tiles found" into an error.
+  const poolPromise = getWorkerPool();
+  // Mark a failure as handled if we return early; awaiting poolPromise below still throws
+  poolPromise.catch(() => {});
   
-  // Detect tile regions
-  const regions = await detectTileRegions(imageFile, expectedRows, expectedCols);
+  const [canvas, regions] = await Promise.all([
+    loadImageToCanvas(imageFile),
+    detectTileRegions(imageFile, expectedRows, expectedCols)
+  ]);
   
   if (regions.length === 0) {
     return { tiles: [], regions: [], method: 'none' };
   }
   
+  const pool = await poolPromise;
+  
   // Get strategies based on preprocessing mode
   const strategies = getStrategies(preprocessingMode);
   console.log(`Using preprocessing mode: ${preprocessingMode} (${strategies.length} strategies)`);
   
-  // Initialize worker pool
-  const pool = new WorkerPool();
-  await pool.initialize(WORKER_POOL_SIZE);
+  // Track best results per tile and whether tile is "done" (high confidence)
+  const bestResults: (TileResult | null)[] = new Array(regions.length).fill(null);
+  const tilesDone: boolean[] = new Array(regions.length).fill(false);
+  const allDebugImages: DebugImage[] = [];
   
-  try {
-    // Track best results per tile and whether tile is "done" (high confidence)
-    const bestResults: (TileResult | null)[] = new Array(regions.length).fill(null);
-    const tilesDone: boolean[] = new Array(regions.length).fill(false);
-    const allDebugImages: DebugImage[] = [];
-    
-    // Process strategies in order
-    for (const strategy of strategies) {
-      // Find tiles that still need processing
-      const tilesToProcess: number[] = [];
-      for (let i = 0; i < regions.length; i++) {
-        if (!tilesDone[i]) {
-          tilesToProcess.push(i);
-        }
-      }
-      
-      // Skip strategy if all tiles are done
-      if (tilesToProcess.length === 0) {
-        console.log(`Skipping ${strategy.name} - all tiles have high confidence results`);
-        break;
+  // Process strategies in order
+  for (const strategy of strategies) {
+    // Find tiles that still need processing
+    const tilesToProcess: number[] = [];
+    for (let i = 0; i < regions.length; i++) {
+      if (!tilesDone[i]) {
+        tilesToProcess.push(i);
       }
+    }
+    
+    // Skip strategy if all tiles are done
+    if (tilesToProcess.length === 0) {
+      console.log(`Skipping ${strategy.name} - all tiles have high confidence results`);
+      break;
+    }
+    
+    console.log(`Running ${strategy.name} on ${tilesToProcess.length} tiles...`);
+    const strategyStartTime = performance.now();
+    
+    // Prepare all tiles for this strategy
+    const preparedTiles = tilesToProcess.map(tileIndex => ({
+      index: tileIndex,
+      canvas: prepareTileForOCR(
+        canvas,
+        regions[tileIndex],
+        strategy,
+        tileIndex,
+        scalingMode,
+        enableDebug ? allDebugImages : undefined
+      ),
+      strategy
+    }));
+    
+    // Process tiles in parallel using worker pool
+    const strategyResults = await processTilesBatch(pool, preparedTiles);
+    
+    // Update best results
+    for (const { index, result } of strategyResults) {
+      const currentBest = bestResults[index];
       
-      console.log(`Running ${strategy.name} on ${tilesToProcess.length} tiles...`);
-      const strategyStartTime = performance.now();
-      
-      // Prepare all tiles for this strategy
-      const preparedTiles = tilesToProcess.map(tileIndex => ({
-        index: tileIndex,
-        canvas: prepareTileForOCR(
-          canvas,
-          regions[tileIndex],
-          strategy,
-          tileIndex,
-          scalingMode,
-          enableDebug ? allDebugImages : undefined
-        ),
-        strategy
-      }));
-      
-      // Process tiles in parallel using worker pool
-      const strategyResults = await processTilesBatch(pool, preparedTiles);
-      
-      // Update best results
-      for (const { index, result } of strategyResults) {
-        const currentBest = bestResults[index];
+      // Update if this result is better
+      if (result.text && (!currentBest || !currentBest.text || result.confidence > currentBest.confidence)) {
+        bestResults[index] = result;
         
-        // Update if this result is better
-        if (result.text && (!currentBest || !currentBest.text || result.confidence > currentBest.confidence)) {
-          bestResults[index] = result;
-          
-          // Mark tile as done if high confidence
-          if (result.confidence >= HIGH_CONFIDENCE_THRESHOLD) {
-            tilesDone[index] = true;
-          }
+        // Mark tile as done if high confidence
+        if (result.confidence >= HIGH_CONFIDENCE_THRESHOLD) {
+          tilesDone[index] = true;
         }
       }
-      
-      console.log(`${strategy.name} completed in ${(performance.now() - strategyStartTime).toFixed(0)}ms`);
     }
     
-    // Collect final results
-    const finalTiles: string[] = [];
-    const usedStrategies: string[] = [];
-    
-    for (let i = 0; i < regions.length; i++) {
-      const best = bestResults[i];
-      if (best?.text) {
-        finalTiles.push(best.text);
-        usedStrategies.push(best.strategy);
-      }
+    console.log(`${strategy.name} completed in ${(performance.now() - strategyStartTime).toFixed(0)}ms`);
+  }
+  
+  // Collect final results
+  const finalTiles: string[] = [];
+  const usedStrategies: string[] = [];
+  
+  for (let i = 0; i < regions.length; i++) {
+    const best = bestResults[i];
+    if (best?.text) {
+      finalTiles.push(best.text);
+      usedStrategies.push(best.strategy);
     }
-    
-    // Log stats
-    const strategyUsage = usedStrategies.reduce((acc, s) => {
-      acc[s] = (acc[s] || 0) + 1;
-      return acc;
-    }, {} as Record<string, number>);
-    console.log('Strategy usage per tile:', strategyUsage);
-    console.log('Detected tiles:', finalTiles);
-    console.log(`Total time: ${(performance.now() - totalStartTime).toFixed(0)}ms`);
-    
-    return {
-      tiles: finalTiles,
-      regions,
-      method: 'per-tile-best-optimized',
-      debugImages: enableDebug ? allDebugImages : undefined
-    };
-  } finally {
-    // Always terminate the worker pool
-    await pool.terminate();
   }
+  
+  // Log stats
+  const strategyUsage = usedStrategies.reduce((acc, s) => {
+    acc[s] = (acc[s] || 0) + 1;
+    return acc;
+  }, {} as Record<string, number>);
+  console.log('Strategy usage per tile:', strategyUsage);
+  console.log('Detected tiles:', finalTiles);
+  console.log(`Total time: ${(performance.now() - totalStartTime).toFixed(0)}ms`);
+  
+  return {
+    tiles: finalTiles,
+    regions,
+    method: 'per-tile-best-optimized',
+    debugImages: enableDebug ? allDebugImages : undefined
+  };
 }
 
 /**
@@ -1,4 +1,4 @@
-import { filterWords, classifyWord, loadDictionary, DictionaryType } from './dictionary';
+import { classifyWord, loadDictionary, DictionaryType } from './dictionary';
 
 export interface WordResult {
   tiles: string[];
@@ -13,23 +13,306 @@ export interface SolveResult {
   dictionarySize: number;
 }
 
-function* generateCombinations(tiles: string[], maxLength: number = 4): Generator<[string[], string]> {
-  function* permute(arr: string[], length: number, current: string[] = []): Generator<[string[], string]> {
-    if (current.length === length) {
-      yield [[...current], current.join('')];
-      return;
+// Quartiles words are made of one to four tiles
+const MAX_TILES_PER_WORD = 4;
+
+const ALPHABET_SIZE = 26;
+const CHAR_CODE_A = 97;
+
+// The root is node 0 and is never anyone's child, so 0 doubles as "no child"
+const ROOT_NODE = 0;
+const NO_CHILD = 0;
+
+// The flat child arrays only have slots for a-z
+const ALPHABETIC = /^[a-z]+$/;
+
+/**
+ * Minimal DAWG (directed acyclic word graph) stored as flat typed arrays: a trie whose
+ * identical suffix subtrees are shared. Only a-z words are stored.
+ */
+interface WordGraph {
+  // children[node * ALPHABET_SIZE + letter] is the child node, or NO_CHILD
+  children: Int32Array;
+  // 1 if a dictionary word ends at the node
+  isWord: Uint8Array;
+}
+
+// Words grouped by first character, each group sorted; built once per word set
+type WordIndex = Map<string, string[]>;
+
+const wordIndexCache = new WeakMap<Set<string>, WordIndex>();
+
+function indexWords(words: Set<string>): WordIndex {
+  const cached = wordIndexCache.get(words);
+  if (cached) return cached;
+
+  const index: WordIndex = new Map();
+  for (const word of words) {
+    const bucket = index.get(word[0]);
+    if (bucket) {
+      bucket.push(word);
+    } else {
+      index.set(word[0], [word]);
     }
-    
-    for (let i = 0; i < arr.length; i++) {
-      const remaining = [...arr.slice(0, i), ...arr.slice(i + 1)];
-      current.push(arr[i]);
-      yield* permute(remaining, length, current);
-      current.pop();
+  }
+  for (const bucket of index.values()) {
+    bucket.sort();
+  }
+
+  wordIndexCache.set(words, index);
+  return index;
+}
+
+/**
+ * Build a minimal word graph of the dictionary words that could possibly be formed from the
+ * tiles: the word must start with some tile's first character and fit within the longest
+ * possible concatenation of MAX_TILES_PER_WORD tiles. Words with characters outside a-z
+ * are skipped: they would index past their node's child slots, and no tile path can
+ * spell them anyway.
+ *
+ * Uses incremental construction over sorted input (Daciuk et al.): once the next word
+ * leaves the previous word's path, the abandoned suffix can never change again, so it is
+ * merged into an equivalent registered node right away. The graph never grows much past
+ * its minimal size, instead of first materializing the full trie.
+ */
+function buildWordGraph(words: Set<string>, tiles: string[]): WordGraph {
+  const index = indexWords(words);
+  const firstChars = [...new Set(tiles.map(tile => tile[0]))].sort();
+  const maxWordLength = [...tiles]
+    .map(tile => tile.length)
+    .sort((a, b) => b - a)
+    .slice(0, MAX_TILES_PER_WORD)
+    .reduce((sum, len) => sum + len, 0);
+
+  let capacity = 1024;
+  let children = new Int32Array(capacity * ALPHABET_SIZE);
+  let isWord = new Uint8Array(capacity);
+  // Bit `letter` is set for every outgoing edge, so nodes can be hashed and compared
+  // without scanning all ALPHABET_SIZE child slots (most nodes have one or two edges)
+  let edgeMasks = new Int32Array(capacity);
+  let nodeCount = 1;
+  const freeNodes: number[] = [];
+
+  function allocateNode(): number {
+    if (freeNodes.length > 0) {
+      return freeNodes.pop()!;
+    }
+    if (nodeCount === capacity) {
+      capacity *= 2;
+      const grownChildren = new Int32Array(capacity * ALPHABET_SIZE);
+      grownChildren.set(children);
+      children = grownChildren;
+      const grownIsWord = new Uint8Array(capacity);
+      grownIsWord.set(isWord);
+      isWord = grownIsWord;
+      const grownEdgeMasks = new Int32Array(capacity);
+      grownEdgeMasks.set(edgeMasks);
+      edgeMasks = grownEdgeMasks;
     }
+    return nodeCount++;
   }
-  
-  for (let r = 1; r <= maxLength; r++) {
-    yield* permute(tiles, r);
+
+  // Registered nodes bucketed by a hash of their word flag and (canonical) outgoing edges
+  const register = new Map<number, number[]>();
+
+  function hashNode(node: number): number {
+    const base = node * ALPHABET_SIZE;
+    let hash = edgeMasks[node] ^ (isWord[node] << ALPHABET_SIZE);
+    for (let mask = edgeMasks[node]; mask !== 0; mask &= mask - 1) {
+      const letter = 31 - Math.clz32(mask & -mask);
+      hash = Math.imul(hash, 0x01000193) ^ children[base + letter];
+    }
+    // Keep the key a small integer so Map lookups stay on the fast path
+    return hash & 0x3fffffff;
+  }
+
+  function sameNode(a: number, b: number): boolean {
+    if (isWord[a] !== isWord[b] || edgeMasks[a] !== edgeMasks[b]) return false;
+    const baseA = a * ALPHABET_SIZE;
+    const baseB = b * ALPHABET_SIZE;
+    for (let mask = edgeMasks[a]; mask !== 0; mask &= mask - 1) {
+      const letter = 31 - Math.clz32(mask & -mask);
+      if (children[baseA + letter] !== children[baseB + letter]) return false;
+    }
+    return true;
+  }
+
+  function findRegistered(bucket: number[], node: number): number {
+    for (const candidate of bucket) {
+      if (sameNode(candidate, node)) return candidate;
+    }
+    return NO_CHILD;
+  }
+
+  // Nodes along the previous word's path; pathNodes[d] is the node after d letters
+  const pathNodes = new Int32Array(maxWordLength + 1);
+  let previous = '';
+
+  // Replace or register the previous word's path nodes deeper than depth, bottom-up
+  function minimizePath(depth: number): void {
+    for (let d = previous.length; d > depth; d--) {
+      const node = pathNodes[d];
+      const hash = hashNode(node);
+      const bucket = register.get(hash);
+      const existing = bucket ? findRegistered(bucket, node) : NO_CHILD;
+      if (existing === NO_CHILD) {
+        if (bucket) {
+          bucket.push(node);
+        } else {
+          register.set(hash, [node]);
+        }
+        continue;
+      }
+
+      // Point the parent at the equivalent node and recycle this one
+      children[pathNodes[d - 1] * ALPHABET_SIZE + previous.charCodeAt(d - 1) - CHAR_CODE_A] = existing;
+      const base = node * ALPHABET_SIZE;
+      for (let mask = edgeMasks[node]; mask !== 0; mask &= mask - 1) {
+        children[base + 31 - Math.clz32(mask & -mask)] = NO_CHILD;
+      }
+      edgeMasks[node] = 0;
+      isWord[node] = 0;
+      freeNodes.push(node);
+    }
+  }
+
+  for (const firstChar of firstChars) {
+    const bucket = index.get(firstChar);
+    if (!bucket) continue;
+
+    for (const word of bucket) {
+      if (word.length > maxWordLength || !ALPHABETIC.test(word)) continue;
+
+      let common = 0;
+      const limit = Math.min(word.length, previous.length);
+      while (common < limit && word.charCodeAt(common) === previous.charCodeAt(common)) {
+        common++;
+      }
+      minimizePath(common);
+
+      let node = pathNodes[common];
+      for (let i = common; i < word.length; i++) {
+        const child = allocateNode();
+        const letter = word.charCodeAt(i) - CHAR_CODE_A;
+        children[node * ALPHABET_SIZE + letter] = child;
+        edgeMasks[node] |= 1 << letter;
+        pathNodes[i + 1] = child;
+        node = child;
+      }
+      isWord[node] = 1;
+      previous = word;
+    }
+  }
+  minimizePath(0);
+
+  return {
+    children: children.subarray(0, nodeCount * ALPHABET_SIZE),
+    isWord: isWord.subarray(0, nodeCount)
+  };
+}
+
+/**
+ * Search every selection of up to MAX_TILES_PER_WORD tiles, walking the word graph as tiles
+ * are appended and calling onHit for each dictionary word of at least minLength characters.
+ * A branch is abandoned as soon as the accumulated string is not a prefix of any word.
+ *
+ * Repeated tiles are enumerated as a multiset: each distinct tile string is tried once
+ * per position with a remaining count, so duplicates never produce the same combination twice.
+ *
+ * The search depth is fixed by the puzzle, so the four levels are written out as nested
+ * loops rather than a recursive generator, and tile arrays are only built for hits.
+ */
+function forEachCombination(
+  tiles: string[],
+  graph: WordGraph,
+  minLength: number,
+  onHit: (tilesCombo: string[], word: string) => void
+): void {
+  const tileCounts = new Map<string, number>();
+  for (const tile of tiles) {
+    tileCounts.set(tile, (tileCounts.get(tile) || 0) + 1);
+  }
+  // Tiles with characters outside a-z can never be part of a dictionary word
+  const uniqueTiles = [...tileCounts.keys()].filter(tile => ALPHABETIC.test(tile));
+  const remaining = uniqueTiles.map(tile => tileCounts.get(tile)!);
+  const tileCount = uniqueTiles.length;
+
+  // Per-tile letter data as parallel arrays: tile i's letters are
+  // tileLetters[tileOffsets[i] .. tileOffsets[i] + tileLengths[i])
+  const tileOffsets = new Int32Array(tileCount);
+  const tileLengths = new Int32Array(tileCount);
+  const tileLetters = new Uint8Array(uniqueTiles.reduce((sum, tile) => sum + tile.length, 0));
+  let offset = 0;
+  uniqueTiles.forEach((tile, i) => {
+    tileOffsets[i] = offset;
+    tileLengths[i] = tile.length;
+    for (let c = 0; c < tile.length; c++) {
+      tileLetters[offset++] = tile.charCodeAt(c) - CHAR_CODE_A;
+    }
+  });
+
+  const { children, isWord } = graph;
+
+  // Walk tile i's letters down the graph from node, bailing out on the first miss
+  function step(node: number, i: number): number {
+    for (let c = tileOffsets[i], end = c + tileLengths[i]; c < end; c++) {
+      node = children[node * ALPHABET_SIZE + tileLetters[c]];
+      if (node === NO_CHILD) break;
+    }
+    return node;
+  }
+
+  // Word lengths are tracked as tiles are added so short hits are skipped before
+  // anything is allocated for them
+  for (let i0 = 0; i0 < tileCount; i0++) {
+    const node0 = step(ROOT_NODE, i0);
+    if (node0 === NO_CHILD) continue;
+    const length0 = tileLengths[i0];
+    const tile0 = uniqueTiles[i0];
+    if (isWord[node0] && length0 >= minLength) {
+      onHit([tile0], tile0);
+    }
+    remaining[i0]--;
+
+    for (let i1 = 0; i1 < tileCount; i1++) {
+      if (remaining[i1] === 0) continue;
+      const node1 = step(node0, i1);
+      if (node1 === NO_CHILD) continue;
+      const length1 = length0 + tileLengths[i1];
+      const tile1 = uniqueTiles[i1];
+      if (isWord[node1] && length1 >= minLength) {
+        onHit([tile0, tile1], tile0 + tile1);
+      }
+      remaining[i1]--;
+
+      for (let i2 = 0; i2 < tileCount; i2++) {
+        if (remaining[i2] === 0) continue;
+        const node2 = step(node1, i2);
+        if (node2 === NO_CHILD) continue;
+        const length2 = length1 + tileLengths[i2];
+        const tile2 = uniqueTiles[i2];
+        if (isWord[node2] && length2 >= minLength) {
+          onHit([tile0, tile1, tile2], tile0 + tile1 + tile2);
+        }
+        remaining[i2]--;
+
+        for (let i3 = 0; i3 < tileCount; i3++) {
+          if (remaining[i3] === 0) continue;
+          const node3 = step(node2, i3);
+          if (node3 === NO_CHILD) continue;
+          const tile3 = uniqueTiles[i3];
+          if (isWord[node3] && length2 + tileLengths[i3] >= minLength) {
+            onHit([tile0, tile1, tile2, tile3], tile0 + tile1 + tile2 + tile3);
+          }
+        }
+
+        remaining[i2]++;
+      }
+
+      remaining[i1]++;
+    }
+
+    remaining[i0]++;
   }
 }
 
@@ -38,9 +321,8 @@ export async function solveQuartiles(
   dictType: DictionaryType = 'twl06',
   minLength: number = 2
 ): Promise<SolveResult> {
-  // Load dictionary
-  const allWords = await loadDictionary(dictType);
-  const validWords = filterWords(allWords);
+  // Load dictionary (already filtered to solver-usable words)
+  const validWords = await loadDictionary(dictType);
   
   // Find all combinations
   const organized: Record<number, WordResult[]> = {
@@ -50,15 +332,23 @@ export async function solveQuartiles(
     4: []
   };
   
-  const seenWords = new Set<string>();
+  // The search can reach the same word through different tile counts; keep the combination
+  // with the fewest tiles, and the first one found among equally short combinations
+  const bestCombos = new Map<string, string[]>();
+  const graph = buildWordGraph(validWords, tiles);
   
-  for (const [tilesCombo, word] of generateCombinations(tiles, 4)) {
-    if (word.length < minLength) continue;
-    if (!validWords.has(word)) continue;
-    if (seenWords.has(word)) continue;
+  forEachCombination(tiles, graph, minLength, (tilesCombo, word) => {
+    const existing = bestCombos.get(word);
+    if (existing && existing.length <= tilesCombo.length) return;
     
-    seenWords.add(word);
+    bestCombos.set(word, tilesCombo);
+  });
+  
+  // Classify each unique word once while bucketing, tallying the summary counts as we go
+  let questionableCount = 0;
+  for (const [word, tilesCombo] of bestCombos) {
     const tags = classifyWord(word);
+    if (tags.length > 0) questionableCount++;
     organized[tilesCombo.length].push({
       tiles: tilesCombo,
       word,
@@ -78,15 +368,9 @@ export async function solveQuartiles(
     });
   }
   
-  const totalFound = Object.values(organized).reduce((sum, arr) => sum + arr.length, 0);
-  const questionableCount = Object.values(organized).reduce(
-    (sum, arr) => sum + arr.filter(r => r.tags.length > 0).length,
-    0
-  );
-  
   return {
     results: organized,
-    totalFound,
+    totalFound: bestCombos.size,
     questionableCount,
     dictionarySize: validWords.size
   };